@@ -2,7 +2,7 @@ import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
 from balance import balance_values
-from pdf import generate_pdf
+from html_report import generate_html
 import pandas as pd
 
 # Hardcoded credentials (in production, use hashed passwords + database)
@@ -175,17 +175,32 @@ function_detail=f"Function Mode : {mode} , Step Size : {step}"
 if name and min(values)>0 :
     import io
 
+report_format = st.sidebar.radio("Report format", ["PDF", "HTML"], horizontal=True)
+
 if name and min(values) > 0:
-    pdf_data = generate_pdf(balanced_data, fig, fig2, name, total_original, total_balance, function_detail, values, balanced_values, labels)
-
-    # ✅ Ensure pdf_data is bytes
-    if isinstance(pdf_data, str):  # If it's a path, read it
-        with open(pdf_data, "rb") as f:
-            pdf_data = f.read()
-
-    st.download_button(
-        label="📄 Download PDF Report",
-        data=pdf_data,
-        file_name=f"{name}-report.pdf",
-        mime="application/pdf"
-    )
\ No newline at end of file
+    if report_format == "PDF":
+        # Imported lazily so the HTML report never loads ReportLab/matplotlib
+        from pdf import generate_pdf
+        pdf_data = generate_pdf(balanced_data, fig, fig2, name, total_original, total_balance, function_detail, values, balanced_values, labels)
+
+        # ✅ Ensure pdf_data is bytes
+        if isinstance(pdf_data, str):  # If it's a path, read it
+            with open(pdf_data, "rb") as f:
+                pdf_data = f.read()
+
+        st.download_button(
+            label="📄 Download PDF Report",
+            data=pdf_data,
+            file_name=f"{name}-report.pdf",
+            mime="application/pdf"
+        )
+    else:
+        # Lightweight report: single HTML file with inline SVG charts
+        html_data = generate_html(balanced_data, name, total_original, total_balance, function_detail, values, balanced_values, labels)
+
+        st.download_button(
+            label="🌐 Download HTML Report",
+            data=html_data,
+            file_name=f"{name}-report.html",
+            mime="text/html"
+        )
\ No newline at end of file
@@ -0,0 +1,107 @@
+"""
+Benchmark the HTML/SVG report against the ReportLab PDF report.
+Run: python bench_report.py [repeats]
+
+Memory is reported two ways: the Python-heap peak traced by tracemalloc in
+this process, and the peak RSS of child processes (Kaleido's Chromium), which
+tracemalloc cannot see. RSS figures are in KiB as reported by Linux.
+"""
+import os
+import sys
+import time
+import tempfile
+import tracemalloc
+import random
+import resource
+
+from balance import balance_values
+from vastu import DIRECTION_LABELS, VASTU_COLORS
+
+try:
+    import pandas as pd
+except ImportError as e:
+    pd = None
+    PANDAS_ERROR = e
+
+
+def sample_report_args():
+    """Return (df, total_original, total_balance, function_detail, values, balanced_values, labels) for a sample project"""
+    random.seed(0)
+    labels = DIRECTION_LABELS
+    values = [round(random.uniform(20, 120), 1) for _ in labels]
+    balanced_values = balance_values(values, 0.5, "both")
+
+    avg = sum(values) / 16
+    total_original = f"Max Line : {(max(values) + avg) / 2} , Min Line : {(min(values) + avg) / 2} , AVG Line : {avg}, Total Area : {sum(values)}"
+    avg = sum(balanced_values) / 16
+    total_balance = f"Max Line : {(max(balanced_values) + avg) / 2} , Min Line : {(min(balanced_values) + avg) / 2} , AVG Line : {avg},Total Area : {sum(values)}"
+    function_detail = "Function Mode : both , Step Size : 0.5"
+
+    df = pd.DataFrame({
+        "Zone": labels,
+        "Original Value": values,
+        "Balanced Value": balanced_values,
+        "Add/Sub": pd.Series(balanced_values) - pd.Series(values)
+    })
+    return df, total_original, total_balance, function_detail, values, balanced_values, labels
+
+
+def _measure(fn, repeats):
+    """Return (best seconds, peak Python-heap bytes) over the given repeats"""
+    fn()  # warm up imports and caches
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    if pd is None:
+        print("HTML report: skipped,", PANDAS_ERROR)
+        print("PDF report: skipped,", PANDAS_ERROR)
+        return
+
+    df, total_original, total_balance, function_detail, values, balanced_values, labels = sample_report_args()
+
+    from html_report import generate_html
+    html_time, html_heap = _measure(
+        lambda: generate_html(df, "bench", total_original, total_balance, function_detail, values, balanced_values, labels),
+        repeats
+    )
+    print(f"HTML report: {html_time * 1000:9.2f} ms  Python heap peak {html_heap / 1024:9.1f} KiB  (no child processes)")
+
+    try:
+        import plotly.graph_objects as go
+        from pdf import generate_pdf, _safe_write_plotly_png
+    except ImportError as e:
+        print("PDF report: skipped,", e)
+        return
+
+    fig1 = go.Figure(go.Bar(x=labels, y=values, marker_color=VASTU_COLORS))
+    fig2 = go.Figure(go.Bar(x=labels, y=balanced_values, marker_color=VASTU_COLORS))
+    pdf_time, pdf_heap = _measure(
+        lambda: generate_pdf(df, fig1, fig2, "bench", total_original, total_balance, function_detail, values, balanced_values, labels),
+        repeats
+    )
+    children_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+
+    # Same chart call generate_pdf makes, after it has set up Kaleido
+    with tempfile.TemporaryDirectory() as tmpdir:
+        chart_path = _safe_write_plotly_png(fig1, os.path.join(tmpdir, "chart.png"),
+                                            fallback_labels=labels, fallback_values=values)
+
+    print(f"PDF report:  {pdf_time * 1000:9.2f} ms  Python heap peak {pdf_heap / 1024:9.1f} KiB  "
+          f"child process peak RSS {children_rss} KiB  (charts via {chart_path})")
+    print(f"HTML is {pdf_time / html_time:.0f}x faster, {pdf_heap / html_heap:.0f}x less Python-heap peak "
+          f"(child process memory not included)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+from string import Template
+from html import escape
+from datetime import datetime
+from vastu import (
+    VASTU_COLORS, LIGHT_ZONE_COLORS, ZONE_LEGEND, get_direction_color_hex, zone_comparison_rows,
+    report_inputs, summary_metrics, metrics_rows, conclusion_text
+)
+
+
+# Page and row templates are defined once at module level; rendering is plain
+# string substitution, no ReportLab layout, rasterized charts or browser render.
+PAGE_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>$project - Vastu Bar Chart Balancing Report</title>
+<style>
+body{font-family:Helvetica,Arial,sans-serif;color:#2c3e50;max-width:960px;margin:40px auto;padding:0 24px}
+h1{font-size:26px;text-align:center;margin-bottom:4px}
+.subtitle{text-align:center;font-style:italic;color:#7f8c8d;margin-bottom:30px}
+h2{font-size:18px;color:#34495e;margin-top:28px}
+table{border-collapse:collapse;width:100%;margin-bottom:12px}
+th,td{border:1px solid #808080;padding:6px 10px;text-align:center;font-size:13px}
+th{font-weight:bold;color:#fff}
+.metrics th{background:#2986FF}
+.metrics tr:nth-child(even) td{background:#f8f9fa}
+.zones th{background:#24FF53}
+.legend th{background:#34495e}
+.legend td{text-align:left}
+.legend td.swatch{width:60px}
+svg{width:100%;height:auto;display:block}
+footer{margin-top:40px;font-size:11px;color:#808080}
+</style>
+</head>
+<body>
+<h1>Vastu Bar Chart Balancing Report</h1>
+<p class="subtitle">Project: $project</p>
+<h2>Executive Summary</h2>
+<table class="metrics">
+<tr><th>Metric</th><th>Original</th><th>Balanced</th><th>Change</th></tr>
+$metrics_rows
+</table>
+<h2>Algorithm Configuration</h2>
+<p>$function_detail</p>
+<h2>Detailed Zone Comparison</h2>
+<table class="zones">
+<tr><th>Zone</th><th>Direction</th><th>Original Value</th><th>Balanced Value</th><th>Difference</th></tr>
+$zone_rows
+</table>
+<h2>Zone Color Legend</h2>
+<table class="legend">
+<tr><th>Color</th><th>Directions</th><th>Element</th></tr>
+$legend_rows
+</table>
+<h2>Original Input Bar Chart</h2>
+$original_chart
+<p>$total_original</p>
+<h2>Balanced Bar Chart</h2>
+$balanced_chart
+<p>$total_balanced</p>
+<h2>Vastu Analysis Conclusion</h2>
+<p>$conclusion</p>
+<footer>Generated on $generated_on</footer>
+</body>
+</html>
+""")
+
+METRIC_ROW = Template("<tr><td>$metric</td><td>$original</td><td>$balanced</td><td>$change</td></tr>")
+ZONE_ROW = Template(
+    '<tr style="background:$background;color:$text">'
+    "<td>$zone</td><td>$direction</td><td>$original</td><td>$balanced</td><td>$difference</td></tr>"
+)
+LEGEND_ROW = Template('<tr><td class="swatch" style="background:$color"></td><td>$directions</td><td>$element</td></tr>')
+
+# Chart canvas geometry in SVG user units
+CHART_WIDTH = 1000
+CHART_HEIGHT = 500
+CHART_LEFT = 60
+CHART_RIGHT = 20
+CHART_TOP = 40
+CHART_BOTTOM = 70
+
+# SVG stroke-dasharray equivalents of Plotly's "dash" and "dot" line styles
+DASH = "8 4"
+DOT = "2 3"
+
+
+def _svg_bar_chart(labels, values, title, x_title, y_title, max_color, min_color, limit_dash):
+    """Render a bar chart with Avg/Max/Min reference lines as an inline SVG string"""
+    if not values:
+        return f'<svg viewBox="0 0 {CHART_WIDTH} 60"><text x="{CHART_WIDTH / 2}" y="35" text-anchor="middle">Chart unavailable</text></svg>'
+
+    avg = sum(values) / len(values)
+    max_line = (max(values) + avg) / 2
+    min_line = (min(values) + avg) / 2
+
+    plot_w = CHART_WIDTH - CHART_LEFT - CHART_RIGHT
+    plot_h = CHART_HEIGHT - CHART_TOP - CHART_BOTTOM
+    y_max = max(values) * 1.1 or 1
+    slot = plot_w / len(values)
+    bar_w = slot * 0.5
+    base = CHART_TOP + plot_h
+
+    def y_of(v):
+        return base - v / y_max * plot_h
+
+    parts = [
+        f'<svg viewBox="0 0 {CHART_WIDTH} {CHART_HEIGHT}" xmlns="http://www.w3.org/2000/svg" font-family="Helvetica,Arial,sans-serif">',
+        f'<text x="{CHART_WIDTH / 2}" y="22" text-anchor="middle" font-size="16" font-weight="bold">{escape(title)}</text>',
+        f'<line x1="{CHART_LEFT}" y1="{base}" x2="{CHART_WIDTH - CHART_RIGHT}" y2="{base}" stroke="#808080"/>',
+        f'<line x1="{CHART_LEFT}" y1="{CHART_TOP}" x2="{CHART_LEFT}" y2="{base}" stroke="#808080"/>',
+    ]
+
+    for i, (label, value) in enumerate(zip(labels, values)):
+        x = CHART_LEFT + i * slot + (slot - bar_w) / 2
+        y = y_of(value)
+        cx = x + bar_w / 2
+        color = VASTU_COLORS[i] if i < len(VASTU_COLORS) else "#b4b4b4"
+        parts.append(f'<rect x="{x:.1f}" y="{y:.1f}" width="{bar_w:.1f}" height="{base - y:.1f}" fill="{color}"/>')
+        parts.append(f'<text x="{cx:.1f}" y="{y - 4:.1f}" text-anchor="middle" font-size="11" font-weight="bold">{value:.1f}</text>')
+        parts.append(
+            f'<text x="{cx:.1f}" y="{base + 16}" text-anchor="end" font-size="11" '
+            f'transform="rotate(-45 {cx:.1f} {base + 16})">{escape(str(label))}</text>'
+        )
+
+    for line_value, color, dash, name in (
+        (avg, "blue", DASH, "Avg Area"),
+        (max_line, max_color, limit_dash, "Max Line"),
+        (min_line, min_color, limit_dash, "Min Line"),
+    ):
+        y = y_of(line_value)
+        parts.append(
+            f'<line x1="{CHART_LEFT}" y1="{y:.1f}" x2="{CHART_WIDTH - CHART_RIGHT}" y2="{y:.1f}" '
+            f'stroke="{color}" stroke-width="2" stroke-dasharray="{dash}" opacity="0.7"/>'
+        )
+        parts.append(
+            f'<text x="{CHART_WIDTH - CHART_RIGHT}" y="{y - 4:.1f}" text-anchor="end" font-size="11" fill="{color}">{name}</text>'
+        )
+
+    parts.append(f'<text x="{CHART_LEFT + plot_w / 2}" y="{CHART_HEIGHT - 6}" text-anchor="middle" font-size="13" font-weight="bold">{escape(x_title)}</text>')
+    parts.append(
+        f'<text x="16" y="{CHART_TOP + plot_h / 2}" text-anchor="middle" font-size="13" font-weight="bold" '
+        f'transform="rotate(-90 16 {CHART_TOP + plot_h / 2})">{escape(y_title)}</text>'
+    )
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def generate_html(
+    df,
+    filename,
+    total_original,
+    total_balanced,
+    function_detail,
+    orig_values=None,
+    bal_values=None,
+    labels=None
+):
+    """Generate a self-contained HTML report with inline SVG charts, a lightweight alternative to generate_pdf"""
+
+    # Default fallback data from df if not provided
+    labels, orig_values, bal_values = report_inputs(df, orig_values, bal_values, labels)
+    orig_values = orig_values or []
+    bal_values = bal_values or []
+    if labels is None:
+        labels = [f"Item {i+1}" for i in range(len(orig_values))]
+
+    # Calculate metrics
+    metrics = summary_metrics(orig_values, bal_values)
+    metrics_html = "\n".join(
+        METRIC_ROW.substitute(metric=m, original=o, balanced=b, change=c)
+        for m, o, b, c in metrics_rows(metrics, orig_values, bal_values)
+    )
+
+    zone_rows = []
+    for idx, label, orig, bal in zone_comparison_rows(df, orig_values, bal_values):
+        direction_color = get_direction_color_hex(label)
+        zone_rows.append(ZONE_ROW.substitute(
+            background=direction_color,
+            text="black" if direction_color in LIGHT_ZONE_COLORS else "white",
+            zone=idx + 1,
+            direction=escape(str(label)),
+            original=f'{orig:.2f}',
+            balanced=f'{bal:.2f}',
+            difference=f'{bal - orig:+.2f}'
+        ))
+
+    legend_rows = "\n".join(
+        LEGEND_ROW.substitute(color=c, directions=d, element=e) for c, d, e in ZONE_LEGEND
+    )
+
+    # Chart titles and reference line styles follow the two Plotly figures in app.py
+    original_chart = _svg_bar_chart(
+        labels, orig_values, "Input Values Bar Chart with Reference Lines", "Zones", "Area",
+        max_color="green", min_color="red", limit_dash=DOT
+    )
+    balanced_chart = _svg_bar_chart(
+        labels, bal_values, "Balanced Directional Areas", "Direction", "Balanced Area (Sq.ft.)",
+        max_color="red", min_color="green", limit_dash=DASH
+    )
+
+    report = PAGE_TEMPLATE.substitute(
+        project=escape(str(filename)),
+        metrics_rows=metrics_html,
+        function_detail=escape(function_detail),
+        zone_rows="\n".join(zone_rows),
+        legend_rows=legend_rows,
+        original_chart=original_chart,
+        total_original=escape(total_original),
+        balanced_chart=balanced_chart,
+        total_balanced=escape(total_balanced),
+        conclusion=conclusion_text(metrics),
+        generated_on=datetime.now().strftime('%B %d, %Y at %I:%M %p')
+    )
+    return report.encode("utf-8")
+
+
+if __name__ == "__main__":
+    # Smoke check: render the benchmark sample data and check the report structure
+    from bench_report import sample_report_args
+
+    df, total_original, total_balance, function_detail, values, balanced_values, labels = sample_report_args()
+    report = generate_html(df, "A&B <Villa>", total_original, total_balance, function_detail,
+                           values, balanced_values, labels).decode("utf-8")
+
+    assert report.count('<tr style="background:') == 16, "expected 16 zone rows"
+    assert report.count("<svg") == 2, "expected two inline SVG charts"
+    assert "Project: A&amp;B &lt;Villa&gt;" in report, "project name not escaped"
+    print(f"HTML report OK: {len(report)} characters")
@@ -10,6 +10,10 @@ import matplotlib.patches as mpatches
 import tempfile
 import os
 from datetime import datetime
+from vastu import (
+    VASTU_COLORS, LIGHT_ZONE_COLORS, get_direction_color_hex, zone_comparison_rows,
+    report_inputs, summary_metrics, metrics_rows, conclusion_text
+)
 
 
 class NumberedCanvas(canvas.Canvas):
@@ -40,33 +44,11 @@ class NumberedCanvas(canvas.Canvas):
         self.drawString(0.75*inch, 0.5*inch, f"Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}")
 
 
-# Vastu directional color scheme matching Streamlit app
-VASTU_COLORS = [
-    "#2986FF",  # NNW - Blue
-    "#2986FF",  # NORTH - Blue
-    "#2986FF",  # NNE - Blue
-    "#2986FF",  # NE - Blue
-    "#24FF53",  # ENE - Green
-    "#24FF53",  # EAST - Green
-    "#24FF53",  # ESE - Green
-    "#FF3232",  # SE - Red
-    "#FF3232",  # SSE - Red
-    "#FF3232",  # SOUTH - Red
-    "#fbff1f",  # SSW - Yellow
-    "#fbff1f",  # SW - Yellow
-    "#b4b4b4",  # WSW - Gray
-    "#b4b4b4",  # WEST - Gray
-    "#b4b4b4",  # WNW - Gray
-    "#b4b4b4",  # NW - Gray
-]
-
-DIRECTION_LABELS = ["NNW","NORTH","NNE","NE","ENE","EAST","ESE","SE","SSE","SOUTH","SSW","SW","WSW","WEST","WNW","NW"]
-
-
 def _safe_write_plotly_png(fig, path_png, fallback_labels=None, fallback_values=None):
     """
     Try saving a Plotly fig to PNG using Kaleido (Chrome required).
     If that fails, fall back to a styled Matplotlib bar chart with Vastu colors.
+    Returns the renderer used: "kaleido" or "matplotlib".
     """
     try:
         import kaleido
@@ -78,7 +60,7 @@ def _safe_write_plotly_png(fig, path_png, fallback_labels=None, fallback_values=
             except Exception as e:
                 print("⚠️ Kaleido portable Chrome fetch failed:", e)
         fig.write_image(path_png, format="png", engine="kaleido", width=1400, height=700)
-        return
+        return "kaleido"
     except Exception as e:
         print("❌ Kaleido export failed:", e)
         print("➡️ Falling back to Matplotlib static render...")
@@ -91,7 +73,7 @@ def _safe_write_plotly_png(fig, path_png, fallback_labels=None, fallback_values=
         plt.axis('off')
         plt.savefig(path_png, dpi=150, bbox_inches='tight', facecolor='white')
         plt.close()
-        return
+        return "matplotlib"
 
     # Create matplotlib fallback with Vastu color scheme
     fig, ax = plt.subplots(figsize=(14, 7), facecolor='white')
@@ -129,15 +111,7 @@ def _safe_write_plotly_png(fig, path_png, fallback_labels=None, fallback_values=
     plt.tight_layout()
     plt.savefig(path_png, dpi=150, bbox_inches='tight', facecolor='white')
     plt.close()
-
-
-def get_direction_color_hex(label):
-    """Get the hex color for a direction label"""
-    try:
-        idx = DIRECTION_LABELS.index(label)
-        return VASTU_COLORS[idx]
-    except (ValueError, IndexError):
-        return "#b4b4b4"  # Default gray
+    return "matplotlib"
 
 
 def hex_to_reportlab_color(hex_color):
@@ -160,20 +134,7 @@ def generate_pdf(
     """Generate a professional-looking PDF report with Vastu color scheme"""
     
     # Default fallback data from df if not provided
-    if labels is None and "Zone" in df.columns:
-        labels = df["Zone"].tolist()
-    elif labels is None and "Label" in df.columns:
-        labels = df["Label"].tolist()
-
-    if orig_values is None:
-        if "Original Value" in df.columns:
-            orig_values = df["Original Value"].tolist()
-        elif "Value" in df.columns:
-            orig_values = df["Value"].tolist()
-
-    if bal_values is None:
-        if "Balanced Value" in df.columns:
-            bal_values = df["Balanced Value"].tolist()
+    labels, orig_values, bal_values = report_inputs(df, orig_values, bal_values, labels)
 
     with tempfile.TemporaryDirectory() as tmpdir:
         fig1_path = os.path.join(tmpdir, "original_chart.png")
@@ -247,24 +208,10 @@ def generate_pdf(
         elements.append(Paragraph("Executive Summary", heading_style))
         
         # Calculate metrics
-        original_sum = sum(orig_values) if orig_values else 0
-        balanced_sum = sum(bal_values) if bal_values else 0
-        original_avg = original_sum / len(orig_values) if orig_values else 0
-        balanced_avg = balanced_sum / len(bal_values) if bal_values else 0
-        original_std = (sum((x - original_avg) ** 2 for x in orig_values) / len(orig_values)) ** 0.5 if orig_values else 0
-        balanced_std = (sum((x - balanced_avg) ** 2 for x in bal_values) / len(bal_values)) ** 0.5 if bal_values else 0
-        
+        metrics = summary_metrics(orig_values, bal_values)
+
         # Metrics table with color-coded header
-        metrics_data = [
-            ['Metric', 'Original', 'Balanced', 'Change'],
-            ['Total Area', f'{original_sum:.2f}', f'{balanced_sum:.2f}', f'{balanced_sum - original_sum:+.2f}'],
-            ['Average Area', f'{original_avg:.2f}', f'{balanced_avg:.2f}', f'{balanced_avg - original_avg:+.2f}'],
-            ['Std Deviation', f'{original_std:.2f}', f'{balanced_std:.2f}', f'{balanced_std - original_std:+.2f}'],
-            ['Min Value', f'{min(orig_values):.2f}' if orig_values else 'N/A', 
-             f'{min(bal_values):.2f}' if bal_values else 'N/A', ''],
-            ['Max Value', f'{max(orig_values):.2f}' if orig_values else 'N/A', 
-             f'{max(bal_values):.2f}' if bal_values else 'N/A', '']
-        ]
+        metrics_data = [['Metric', 'Original', 'Balanced', 'Change']] + metrics_rows(metrics, orig_values, bal_values)
 
         metrics_table = Table(metrics_data, colWidths=[2*inch, 1.5*inch, 1.5*inch, 1.5*inch])
         metrics_table.setStyle(TableStyle([
@@ -309,26 +256,7 @@ def generate_pdf(
             ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
         ]
         
-        for idx, row in df.iterrows():
-            if "Zone" in df.columns:
-                label = row["Zone"]
-            elif "Label" in df.columns:
-                label = row["Label"]
-            else:
-                label = f"Item {idx+1}"
-            
-            if "Original Value" in df.columns:
-                orig = row["Original Value"]
-            elif "Value" in df.columns:
-                orig = row["Value"]
-            else:
-                orig = orig_values[idx] if orig_values else 0
-            
-            if "Balanced Value" in df.columns:
-                bal = row["Balanced Value"]
-            else:
-                bal = bal_values[idx] if bal_values else 0
-            
+        for idx, label, orig, bal in zone_comparison_rows(df, orig_values, bal_values):
             diff = bal - orig
             
             # Get color for this direction
@@ -347,7 +275,7 @@ def generate_pdf(
             table_styles.append(('BACKGROUND', (0, row_num), (-1, row_num), hex_to_reportlab_color(direction_color)))
             
             # Adjust text color based on background brightness
-            if direction_color in ['#fbff1f', '#24FF53', '#b4b4b4']:  # Yellow, Green, Gray - use dark text
+            if direction_color in LIGHT_ZONE_COLORS:  # Yellow, Green, Gray - use dark text
                 table_styles.append(('TEXTCOLOR', (0, row_num), (-1, row_num), colors.black))
             else:  # Blue and Red - use white text
                 table_styles.append(('TEXTCOLOR', (0, row_num), (-1, row_num), colors.white))
@@ -423,16 +351,7 @@ def generate_pdf(
         elements.append(Spacer(1, 0.3*inch))
         elements.append(Paragraph("Vastu Analysis Conclusion", heading_style))
         
-        variance_reduction = ((original_std - balanced_std) / original_std * 100) if original_std > 0 else 0
-        conclusion_text = f"""
-        The Vastu balancing algorithm successfully reduced the standard deviation by {variance_reduction:.1f}%, 
-        resulting in a more harmonious distribution of energy across all directional zones. The total area 
-        changed from {original_sum:.2f} to {balanced_sum:.2f}, representing a {((balanced_sum - original_sum) / original_sum * 100) if original_sum != 0 else 0:.2f}% change.
-        This balanced configuration promotes better energy flow according to Vastu principles, with each 
-        directional zone (North-Water, East-Wood, South-Fire, Southwest-Earth, West-Metal) approaching 
-        optimal proportions.
-        """
-        elements.append(Paragraph(conclusion_text, body_style))
+        elements.append(Paragraph(conclusion_text(metrics), body_style))
 
         # Build PDF with custom canvas
         doc.build(elements, canvasmaker=NumberedCanvas)
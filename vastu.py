@@ -0,0 +1,140 @@
+# Vastu directional color scheme matching Streamlit app
+VASTU_COLORS = [
+    "#2986FF",  # NNW - Blue
+    "#2986FF",  # NORTH - Blue
+    "#2986FF",  # NNE - Blue
+    "#2986FF",  # NE - Blue
+    "#24FF53",  # ENE - Green
+    "#24FF53",  # EAST - Green
+    "#24FF53",  # ESE - Green
+    "#FF3232",  # SE - Red
+    "#FF3232",  # SSE - Red
+    "#FF3232",  # SOUTH - Red
+    "#fbff1f",  # SSW - Yellow
+    "#fbff1f",  # SW - Yellow
+    "#b4b4b4",  # WSW - Gray
+    "#b4b4b4",  # WEST - Gray
+    "#b4b4b4",  # WNW - Gray
+    "#b4b4b4",  # NW - Gray
+]
+
+DIRECTION_LABELS = ["NNW","NORTH","NNE","NE","ENE","EAST","ESE","SE","SSE","SOUTH","SSW","SW","WSW","WEST","WNW","NW"]
+
+# Yellow, Green, Gray backgrounds need dark text; Blue and Red use white text
+LIGHT_ZONE_COLORS = ['#fbff1f', '#24FF53', '#b4b4b4']
+
+# (color, directions, element) rows for the zone color legend
+ZONE_LEGEND = [
+    ('#2986FF', 'NNW, NORTH, NNE, NE', 'Water (North)'),
+    ('#24FF53', 'ENE, EAST, ESE', 'Wood (East)'),
+    ('#FF3232', 'SE, SSE, SOUTH', 'Fire (South)'),
+    ('#fbff1f', 'SSW, SW', 'Earth (Southwest)'),
+    ('#b4b4b4', 'WSW, WEST, WNW, NW', 'Metal (West)'),
+]
+
+
+def get_direction_color_hex(label):
+    """Get the hex color for a direction label"""
+    try:
+        idx = DIRECTION_LABELS.index(label)
+        return VASTU_COLORS[idx]
+    except (ValueError, IndexError):
+        return "#b4b4b4"  # Default gray
+
+
+def zone_comparison_rows(df, orig_values=None, bal_values=None):
+    """Return (index, label, original, balanced) for each row of the zone comparison table"""
+    rows = []
+    for idx, row in df.iterrows():
+        if "Zone" in df.columns:
+            label = row["Zone"]
+        elif "Label" in df.columns:
+            label = row["Label"]
+        else:
+            label = f"Item {idx+1}"
+
+        if "Original Value" in df.columns:
+            orig = row["Original Value"]
+        elif "Value" in df.columns:
+            orig = row["Value"]
+        else:
+            orig = orig_values[idx] if orig_values else 0
+
+        if "Balanced Value" in df.columns:
+            bal = row["Balanced Value"]
+        else:
+            bal = bal_values[idx] if bal_values else 0
+
+        rows.append((idx, label, orig, bal))
+    return rows
+
+
+def report_inputs(df, orig_values=None, bal_values=None, labels=None):
+    """Fill in labels, original and balanced values from df when not provided"""
+    if labels is None and "Zone" in df.columns:
+        labels = df["Zone"].tolist()
+    elif labels is None and "Label" in df.columns:
+        labels = df["Label"].tolist()
+
+    if orig_values is None:
+        if "Original Value" in df.columns:
+            orig_values = df["Original Value"].tolist()
+        elif "Value" in df.columns:
+            orig_values = df["Value"].tolist()
+
+    if bal_values is None:
+        if "Balanced Value" in df.columns:
+            bal_values = df["Balanced Value"].tolist()
+
+    return labels, orig_values, bal_values
+
+
+def summary_metrics(orig_values, bal_values):
+    """Return total, average and standard deviation of the original and balanced values"""
+    original_sum = sum(orig_values) if orig_values else 0
+    balanced_sum = sum(bal_values) if bal_values else 0
+    original_avg = original_sum / len(orig_values) if orig_values else 0
+    balanced_avg = balanced_sum / len(bal_values) if bal_values else 0
+    original_std = (sum((x - original_avg) ** 2 for x in orig_values) / len(orig_values)) ** 0.5 if orig_values else 0
+    balanced_std = (sum((x - balanced_avg) ** 2 for x in bal_values) / len(bal_values)) ** 0.5 if bal_values else 0
+    return {
+        "original_sum": original_sum,
+        "balanced_sum": balanced_sum,
+        "original_avg": original_avg,
+        "balanced_avg": balanced_avg,
+        "original_std": original_std,
+        "balanced_std": balanced_std,
+    }
+
+
+def metrics_rows(metrics, orig_values, bal_values):
+    """Return the executive summary rows as [metric, original, balanced, change]"""
+    return [
+        ['Total Area', f'{metrics["original_sum"]:.2f}', f'{metrics["balanced_sum"]:.2f}',
+         f'{metrics["balanced_sum"] - metrics["original_sum"]:+.2f}'],
+        ['Average Area', f'{metrics["original_avg"]:.2f}', f'{metrics["balanced_avg"]:.2f}',
+         f'{metrics["balanced_avg"] - metrics["original_avg"]:+.2f}'],
+        ['Std Deviation', f'{metrics["original_std"]:.2f}', f'{metrics["balanced_std"]:.2f}',
+         f'{metrics["balanced_std"] - metrics["original_std"]:+.2f}'],
+        ['Min Value', f'{min(orig_values):.2f}' if orig_values else 'N/A',
+         f'{min(bal_values):.2f}' if bal_values else 'N/A', ''],
+        ['Max Value', f'{max(orig_values):.2f}' if orig_values else 'N/A',
+         f'{max(bal_values):.2f}' if bal_values else 'N/A', '']
+    ]
+
+
+def conclusion_text(metrics):
+    """Return the Vastu analysis conclusion paragraph"""
+    original_sum = metrics["original_sum"]
+    balanced_sum = metrics["balanced_sum"]
+    original_std = metrics["original_std"]
+    variance_reduction = ((original_std - metrics["balanced_std"]) / original_std * 100) if original_std > 0 else 0
+    total_change = ((balanced_sum - original_sum) / original_sum * 100) if original_sum != 0 else 0
+    return (
+        f"The Vastu balancing algorithm successfully reduced the standard deviation by {variance_reduction:.1f}%, "
+        f"resulting in a more harmonious distribution of energy across all directional zones. The total area "
+        f"changed from {original_sum:.2f} to {balanced_sum:.2f}, representing a {total_change:.2f}% change. "
+        f"This balanced configuration promotes better energy flow according to Vastu principles, with each "
+        f"directional zone (North-Water, East-Wood, South-Fire, Southwest-Earth, West-Metal) approaching "
+        f"optimal proportions."
+    )